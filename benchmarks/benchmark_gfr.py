@@ -0,0 +1,29 @@
+# Benchmark of eGFR over a creatinine col: the row by row calculateGFR
+# (apply), and calculateGFRArray with safePower (np.float_power).
+# Run with `python benchmarks/benchmark_gfr.py [rows]`
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(f"{ROOT_PATH}/tests")
+from test_safe_power import FACTORS, synthetic_sample, calculateGFR, calculateGFRArray
+
+
+def timed(function) -> tuple:
+  start = time.perf_counter()
+  values = function()
+  return time.perf_counter() - start, values
+
+
+if __name__ == "__main__":
+  rows = int(sys.argv[1]) if len(sys.argv) > 1 else 440_000
+  data = synthetic_sample(rows)
+  sex, age, creatinine = data["sex"].to_numpy(), data["age"].to_numpy(), data["creatinine"].to_numpy()
+  apply_time, old = timed(lambda: data.apply(lambda x: calculateGFR(FACTORS, x["sex"], x["age"], x["creatinine"]), axis=1).to_numpy(dtype=float))
+  array_time, new = timed(lambda: calculateGFRArray(FACTORS, sex, age, creatinine))
+  equal = np.sum((new == old) | (np.isnan(new) & np.isnan(old)))
+  print(f"{rows} rows: apply {apply_time:.2f}s -> array {array_time:.3f}s")
+  print(f"values equal: {equal} of {rows}, max relative difference: {np.nanmax(np.abs(new - old) / np.abs(old)):.1e}")